@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import os
 import random
 import re
+import sqlite3
 import time
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from importlib.util import find_spec
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
+import ahocorasick
+import aiohttp
+import numpy as np
+import orjson
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 
 
 # -----------------------------
@@ -22,17 +32,58 @@ USER_AGENT = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
+# Only advertise brotli when a decoder is installed; both requests and aiohttp
+# pick up either package automatically.
+HAS_BROTLI = find_spec("brotli") is not None or find_spec("brotlicffi") is not None
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+REMOTEOK_API_URL = "https://remoteok.com/api"
+REMOTIVE_API_URL = "https://remotive.com/api/remote-jobs"
+
+# Connection pool sizing; keep-alive connections are reused across requests
+# to the same host.
+HTTP_POOL_LIMIT = 20
+DNS_CACHE_TTL_S = 300
+
+# (connect, read) timeouts in seconds: fail fast on dead hosts, but give slow
+# API responses time to arrive.
+HTTP_TIMEOUT = (5.0, 30.0)
+Timeout = Union[float, Tuple[float, float]]
+
+# Below this many rows, feature extraction in `clean_posts` stays in-process;
+# worker start-up and pickling would cost more than they save.
+PARALLEL_MIN_ROWS = 5000
+
+# dtype for the text columns of the raw DataFrame returned by collect_posts.
+RAW_STRING_DTYPE = "string[pyarrow]"
+
 SESSION = requests.Session()
-SESSION.headers.update(
-    {
-        "User-Agent": USER_AGENT,
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
-)
+SESSION.headers.update(DEFAULT_HEADERS)
+# Retries are handled by polite_get, not urllib3.
+SESSION.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_LIMIT, pool_maxsize=HTTP_POOL_LIMIT, max_retries=0))
 
 random.seed(42)
 
+# Every character re's \s matches (i.e. str.isspace()), spelled out so the same
+# pattern also works in pyarrow's RE2 string kernels, where \s is ASCII-only.
+_WS_CHARS = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+_WS_PATTERN = f"[{_WS_CHARS}]+"
+_WS_RE = re.compile(_WS_PATTERN)
+_SALARY_NUM_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(k)?")
+_ASCII_DIGITS = frozenset("0123456789")
+_ASCII_SPACES = frozenset(c for c in map(chr, range(128)) if c.isspace())
+
 
 # -----------------------------
 # Data model
@@ -63,6 +114,12 @@ class JobPost:
     scraped_at_utc : str
         ISO timestamp for when this record was scraped.
     """
+    # Declared by hand (rather than dataclass(slots=True)) to stay compatible with Python 3.9.
+    __slots__ = (
+        "source", "title", "company", "location", "date_posted_raw",
+        "salary_raw", "url", "description", "scraped_at_utc",
+    )
+
     source: str
     title: str
     company: str
@@ -74,6 +131,63 @@ class JobPost:
     scraped_at_utc: str
 
 
+class DescriptionCache:
+    """
+    SQLite cache of cleaned job descriptions keyed by (source, url).
+
+    Lets repeated runs skip HTML parsing and cleaning for posts that have
+    already been seen. Use as a context manager: the connection is opened on
+    entry and changes are committed once on a clean exit. Cached text is
+    reused as-is, so edits to an existing posting are not picked up.
+
+    Parameters
+    ----------
+    path : str
+        SQLite database file (created if missing).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "DescriptionCache":
+        # The scrapers may run on run_coroutine's helper thread.
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions ("
+            "source TEXT NOT NULL, url TEXT NOT NULL, description TEXT NOT NULL, "
+            "scraped_at_utc TEXT NOT NULL, PRIMARY KEY (source, url))"
+        )
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        assert self._conn is not None
+        if exc_type is None:
+            self._conn.commit()
+        self._conn.close()
+        self._conn = None
+
+    def get(self, source: str, url: str) -> Optional[str]:
+        """
+        Return the cached description for a post, or None if not cached.
+        """
+        assert self._conn is not None, "DescriptionCache must be used as a context manager"
+        row = self._conn.execute(
+            "SELECT description FROM descriptions WHERE source = ? AND url = ?", (source, url)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, source: str, url: str, description: str, scraped_at_utc: str) -> None:
+        """
+        Store (or replace) the cleaned description for a post.
+        """
+        assert self._conn is not None, "DescriptionCache must be used as a context manager"
+        self._conn.execute(
+            "INSERT OR REPLACE INTO descriptions (source, url, description, scraped_at_utc) VALUES (?, ?, ?, ?)",
+            (source, url, description, scraped_at_utc),
+        )
+
+
 # -----------------------------
 # Helpers
 # -----------------------------
@@ -103,10 +217,87 @@ def clean_text(s: str) -> str:
     str
         Cleaned text.
     """
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return _WS_RE.sub(" ", (s or "")).strip()
+
+
+def clean_text_series(s: pd.Series) -> pd.Series:
+    """
+    Vectorized `clean_text` for a Series of strings.
+
+    String-dtype columns (e.g. "string[pyarrow]") keep their dtype.
+
+    Parameters
+    ----------
+    s : pandas.Series
+        Input text column (missing values become "").
+
+    Returns
+    -------
+    pandas.Series
+        Cleaned text column.
+    """
+    s = s.fillna("")
+    if not isinstance(s.dtype, pd.StringDtype):
+        s = s.astype(str)
+    # A pattern string (not a compiled regex) lets Arrow-backed columns use
+    # pyarrow's vectorized kernels instead of a per-element fallback.
+    return s.str.replace(_WS_PATTERN, " ", regex=True).str.strip()
 
 
-def polite_get(url: str, timeout: int = 30, retries: int = 3, backoff_s: float = 1.2) -> str:
+def html_to_text(html: str) -> str:
+    """
+    Extract visible text from an HTML fragment.
+
+    Strings without markup or entities are returned unchanged without being
+    parsed. Script, style, and template contents are dropped.
+
+    Parameters
+    ----------
+    html : str
+        HTML (or plain) text.
+
+    Returns
+    -------
+    str
+        Text content with nodes joined by spaces.
+    """
+    if "<" not in html and "&" not in html:
+        return html
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style", "template"])
+    return tree.text(separator=" ")
+
+
+def _retry_delay(attempt: int, backoff_s: float) -> float:
+    """
+    Seconds to wait before `attempt` (1-based): none before the first try,
+    then exponential backoff with a little jitter.
+    """
+    if attempt <= 1:
+        return 0.0
+    return backoff_s * (2 ** (attempt - 2)) + random.random() * 0.2
+
+
+def _polite_response(url: str, timeout: Timeout, retries: int, backoff_s: float) -> requests.Response:
+    """
+    Shared retry loop behind `polite_get` and `polite_get_bytes`.
+    """
+    last_err: Optional[Exception] = None
+    for attempt in range(1, retries + 1):
+        try:
+            delay = _retry_delay(attempt, backoff_s)
+            if delay:
+                time.sleep(delay)
+            resp = SESSION.get(url, timeout=timeout)
+            if resp.status_code == 200 and resp.content:
+                return resp
+            last_err = RuntimeError(f"HTTP {resp.status_code} for {url}")
+        except Exception as e:
+            last_err = e
+    raise RuntimeError(f"Failed to fetch {url}. Last error: {last_err}")
+
+
+def polite_get(url: str, timeout: Timeout = HTTP_TIMEOUT, retries: int = 3, backoff_s: float = 1.2) -> str:
     """
     Fetch a URL with retries and small backoff.
 
@@ -114,8 +305,8 @@ def polite_get(url: str, timeout: int = 30, retries: int = 3, backoff_s: float =
     ----------
     url : str
         URL to fetch.
-    timeout : int
-        Timeout in seconds.
+    timeout : float | (float, float)
+        Timeout in seconds, or a (connect, read) pair.
     retries : int
         Number of attempts.
     backoff_s : float
@@ -131,19 +322,121 @@ def polite_get(url: str, timeout: int = 30, retries: int = 3, backoff_s: float =
     RuntimeError
         If all retries fail.
     """
+    return _polite_response(url, timeout, retries, backoff_s).text
+
+
+def polite_get_bytes(url: str, timeout: Timeout = HTTP_TIMEOUT, retries: int = 3, backoff_s: float = 1.2) -> bytes:
+    """
+    Like `polite_get`, but return the undecoded response body.
+
+    Useful for JSON APIs, where `orjson` parses the bytes directly.
+
+    Parameters
+    ----------
+    url : str
+        URL to fetch.
+    timeout : float | (float, float)
+        Timeout in seconds, or a (connect, read) pair.
+    retries : int
+        Number of attempts.
+    backoff_s : float
+        Base backoff in seconds.
+
+    Returns
+    -------
+    bytes
+        Raw response body.
+
+    Raises
+    ------
+    RuntimeError
+        If all retries fail.
+    """
+    return _polite_response(url, timeout, retries, backoff_s).content
+
+
+async def fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: Optional[Dict[str, str]] = None,
+    timeout: Timeout = HTTP_TIMEOUT,
+    retries: int = 3,
+    backoff_s: float = 1.2,
+) -> bytes:
+    """
+    Asynchronously fetch a URL with retries and small backoff.
+
+    Async counterpart of `polite_get_bytes`.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Shared client session.
+    url : str
+        URL to fetch.
+    params : dict | None
+        Optional query parameters.
+    timeout : float | (float, float)
+        Timeout in seconds, or a (connect, read) pair.
+    retries : int
+        Number of attempts.
+    backoff_s : float
+        Base backoff in seconds.
+
+    Returns
+    -------
+    bytes
+        Raw response body.
+
+    Raises
+    ------
+    RuntimeError
+        If all retries fail.
+    """
+    connect_s, read_s = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    client_timeout = aiohttp.ClientTimeout(sock_connect=connect_s, sock_read=read_s)
+
     last_err: Optional[Exception] = None
     for attempt in range(1, retries + 1):
         try:
-            time.sleep(backoff_s * (attempt - 1) + random.random() * 0.4)
-            resp = SESSION.get(url, timeout=timeout)
-            if resp.status_code == 200 and resp.text:
-                return resp.text
-            last_err = RuntimeError(f"HTTP {resp.status_code} for {url}")
+            delay = _retry_delay(attempt, backoff_s)
+            if delay:
+                await asyncio.sleep(delay)
+            async with session.get(url, params=params, timeout=client_timeout) as resp:
+                body = await resp.read()
+                if resp.status == 200 and body:
+                    return body
+                last_err = RuntimeError(f"HTTP {resp.status} for {url}")
         except Exception as e:
             last_err = e
     raise RuntimeError(f"Failed to fetch {url}. Last error: {last_err}")
 
 
+def run_coroutine(coro: Any) -> Any:
+    """
+    Run a coroutine to completion and return its result.
+
+    Works both from plain scripts and from environments that already run an
+    event loop (e.g., Jupyter), where the coroutine is run in a helper thread.
+
+    Parameters
+    ----------
+    coro : coroutine
+        Coroutine to run.
+
+    Returns
+    -------
+    Any
+        Result of the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()
+
+
 def posts_to_dicts(posts: List[JobPost]) -> List[Dict[str, Any]]:
     """
     Convert a list of JobPost objects to a list of dictionaries.
@@ -158,30 +451,48 @@ def posts_to_dicts(posts: List[JobPost]) -> List[Dict[str, Any]]:
     list[dict]
         List of dictionaries suitable for DataFrame creation.
     """
-    return [asdict(p) for p in posts]
+    fields = JobPost.__slots__
+    return [{f: getattr(p, f) for f in fields} for p in posts]
 
 
 # -----------------------------
 # Scrapers
 # -----------------------------
-def scrape_remoteok(limit: int = 200) -> List[JobPost]:
+def _clean_description(
+    raw: Any, source: str, url: str, scraped_at: str, cache: Optional[DescriptionCache]
+) -> str:
     """
-    Fetch remote job postings from the RemoteOK public API.
+    Convert a raw HTML description to clean text, going through `cache` if given.
+    """
+    if cache is not None:
+        cached = cache.get(source, url)
+        if cached is not None:
+            return cached
+    desc = clean_text(html_to_text(raw or ""))
+    if cache is not None:
+        cache.put(source, url, desc, scraped_at)
+    return desc
+
+
+def _parse_remoteok(data: Any, limit: int, cache: Optional[DescriptionCache] = None) -> List[JobPost]:
+    """
+    Convert a decoded RemoteOK API payload into job posts.
 
     Parameters
     ----------
+    data : Any
+        Decoded JSON payload (a list whose first item is a legal notice).
     limit : int
         Maximum number of job postings to return.
+    cache : DescriptionCache | None
+        Optional cache of cleaned descriptions.
 
     Returns
     -------
     list[JobPost]
-        Scraped job posts.
+        Parsed job posts.
     """
-    url = "https://remoteok.com/api"
-    text = polite_get(url)
-    data = json.loads(text)
-
+    scraped_at = now_utc_iso()
     posts: List[JobPost] = []
     for item in data[1:]:
         if not isinstance(item, dict):
@@ -198,13 +509,11 @@ def scrape_remoteok(limit: int = 200) -> List[JobPost]:
             job_url = "https://remoteok.com" + job_url
         job_url = clean_text(str(job_url))
 
-        desc = item.get("description") or ""
-        desc = BeautifulSoup(desc, "html.parser").get_text(" ")
-        desc = clean_text(desc)
-
         if not title or not company or not job_url:
             continue
 
+        desc = _clean_description(item.get("description"), "RemoteOK", job_url, scraped_at, cache)
+
         posts.append(
             JobPost(
                 source="RemoteOK",
@@ -215,7 +524,7 @@ def scrape_remoteok(limit: int = 200) -> List[JobPost]:
                 salary_raw=salary_raw,
                 url=job_url,
                 description=desc,
-                scraped_at_utc=now_utc_iso(),
+                scraped_at_utc=scraped_at,
             )
         )
         if len(posts) >= limit:
@@ -224,37 +533,26 @@ def scrape_remoteok(limit: int = 200) -> List[JobPost]:
     return posts
 
 
-def scrape_remotive(limit: int = 200, category: Optional[str] = None, search: Optional[str] = None) -> List[JobPost]:
+def _parse_remotive(payload: Any, limit: int, cache: Optional[DescriptionCache] = None) -> List[JobPost]:
     """
-    Fetch remote job postings from the Remotive public API.
+    Convert a decoded Remotive API payload into job posts.
 
     Parameters
     ----------
+    payload : Any
+        Decoded JSON payload (a dict with a "jobs" list).
     limit : int
         Maximum number of job postings to return.
-    category : str | None
-        Optional Remotive category (example: "software-dev").
-    search : str | None
-        Optional search query (example: "data", "machine learning").
+    cache : DescriptionCache | None
+        Optional cache of cleaned descriptions.
 
     Returns
     -------
     list[JobPost]
-        Scraped job posts.
+        Parsed job posts.
     """
-    base = "https://remotive.com/api/remote-jobs"
-    params: Dict[str, str] = {}
-    if category:
-        params["category"] = category
-    if search:
-        params["search"] = search
-
-    resp = SESSION.get(base, params=params, timeout=30)
-    if resp.status_code != 200:
-        return []
-
-    payload = resp.json()
     jobs = payload.get("jobs", []) if isinstance(payload, dict) else []
+    scraped_at = now_utc_iso()
     posts: List[JobPost] = []
 
     for j in jobs:
@@ -265,13 +563,11 @@ def scrape_remotive(limit: int = 200, category: Optional[str] = None, search: Op
         salary_raw = clean_text(str(j.get("salary", "")))
         job_url = clean_text(str(j.get("url", "")))
 
-        desc = j.get("description", "") or ""
-        desc = BeautifulSoup(desc, "html.parser").get_text(" ")
-        desc = clean_text(desc)
-
         if not title or not company or not job_url:
             continue
 
+        desc = _clean_description(j.get("description"), "Remotive", job_url, scraped_at, cache)
+
         posts.append(
             JobPost(
                 source="Remotive",
@@ -282,7 +578,7 @@ def scrape_remotive(limit: int = 200, category: Optional[str] = None, search: Op
                 salary_raw=salary_raw,
                 url=job_url,
                 description=desc,
-                scraped_at_utc=now_utc_iso(),
+                scraped_at_utc=scraped_at,
             )
         )
         if len(posts) >= limit:
@@ -291,6 +587,129 @@ def scrape_remotive(limit: int = 200, category: Optional[str] = None, search: Op
     return posts
 
 
+def _remotive_params(category: Optional[str], search: Optional[str]) -> Dict[str, str]:
+    """
+    Build Remotive query parameters, omitting empty values.
+    """
+    params: Dict[str, str] = {}
+    if category:
+        params["category"] = category
+    if search:
+        params["search"] = search
+    return params
+
+
+def scrape_remoteok(limit: int = 200, cache: Optional[DescriptionCache] = None) -> List[JobPost]:
+    """
+    Fetch remote job postings from the RemoteOK public API.
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of job postings to return.
+    cache : DescriptionCache | None
+        Optional cache of cleaned descriptions.
+
+    Returns
+    -------
+    list[JobPost]
+        Scraped job posts.
+    """
+    return _parse_remoteok(orjson.loads(polite_get_bytes(REMOTEOK_API_URL)), limit, cache)
+
+
+def scrape_remotive(
+    limit: int = 200,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    cache: Optional[DescriptionCache] = None,
+) -> List[JobPost]:
+    """
+    Fetch remote job postings from the Remotive public API.
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of job postings to return.
+    category : str | None
+        Optional Remotive category (example: "software-dev").
+    search : str | None
+        Optional search query (example: "data", "machine learning").
+    cache : DescriptionCache | None
+        Optional cache of cleaned descriptions.
+
+    Returns
+    -------
+    list[JobPost]
+        Scraped job posts.
+    """
+    resp = SESSION.get(REMOTIVE_API_URL, params=_remotive_params(category, search), timeout=HTTP_TIMEOUT)
+    if resp.status_code != 200:
+        return []
+
+    return _parse_remotive(orjson.loads(resp.content), limit, cache)
+
+
+async def scrape_remoteok_async(
+    session: aiohttp.ClientSession, limit: int = 200, cache: Optional[DescriptionCache] = None
+) -> List[JobPost]:
+    """
+    Async version of `scrape_remoteok` using a shared aiohttp session.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Shared client session.
+    limit : int
+        Maximum number of job postings to return.
+    cache : DescriptionCache | None
+        Optional cache of cleaned descriptions.
+
+    Returns
+    -------
+    list[JobPost]
+        Scraped job posts.
+    """
+    body = await fetch(session, REMOTEOK_API_URL)
+    return _parse_remoteok(orjson.loads(body), limit, cache)
+
+
+async def scrape_remotive_async(
+    session: aiohttp.ClientSession,
+    limit: int = 200,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    cache: Optional[DescriptionCache] = None,
+) -> List[JobPost]:
+    """
+    Async version of `scrape_remotive` using a shared aiohttp session.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Shared client session.
+    limit : int
+        Maximum number of job postings to return.
+    category : str | None
+        Optional Remotive category (example: "software-dev").
+    search : str | None
+        Optional search query (example: "data", "machine learning").
+    cache : DescriptionCache | None
+        Optional cache of cleaned descriptions.
+
+    Returns
+    -------
+    list[JobPost]
+        Scraped job posts (empty if the API cannot be reached).
+    """
+    try:
+        body = await fetch(session, REMOTIVE_API_URL, params=_remotive_params(category, search))
+    except RuntimeError:
+        return []
+
+    return _parse_remotive(orjson.loads(body), limit, cache)
+
+
 # -----------------------------
 # Feature extraction and cleaning
 # -----------------------------
@@ -302,6 +721,8 @@ SKILLS = [
     "react", "node", "flask", "django", "fastapi",
     "postgresql", "mysql", "mongodb", "git",
 ]
+# Text is lowercased before matching, so keep the table lowercase too.
+SKILLS = [sk.lower() for sk in SKILLS]
 
 ROLE_KEYWORDS = {
     "Data Scientist": ["data scientist", "data science"],
@@ -318,11 +739,110 @@ REGION_KEYWORDS = {
     "Central": ["tx", "texas", "il", "illinois", "co", "colorado", "ga", "georgia"],
 }
 
+# One alternation per bucket, in priority order, for the vectorized path in
+# `clean_posts`.
+_ROLE_PATTERNS = {role: "|".join(map(re.escape, keys)) for role, keys in ROLE_KEYWORDS.items()}
+_REGION_PATTERNS = {region: "|".join(map(re.escape, keys)) for region, keys in REGION_KEYWORDS.items()}
+_REGION_PATTERNS["Remote/Unspecified"] = "remote"
+
+# Flattened (keyword, label) pairs in the same priority order, for the scalar
+# classifiers.
+_ROLE_KEYWORD_PAIRS = tuple((k, role) for role, keys in ROLE_KEYWORDS.items() for k in keys)
+_REGION_KEYWORD_PAIRS = tuple((k, region) for region, keys in REGION_KEYWORDS.items() for k in keys) + (
+    ("remote", "Remote/Unspecified"),
+)
+
+
+class SkillMatcher(NamedTuple):
+    """
+    Precomputed scanners for one skill list (see `build_skill_matcher`).
+    """
+    automaton: Optional[Any]
+    single_re: Optional["re.Pattern[str]"]
+    order: Dict[str, int]
+    first_char_re: Optional["re.Pattern[str]"]
+
+
+def build_skill_matcher(skill_list: List[str]) -> SkillMatcher:
+    """
+    Precompute the scanners used by `extract_skills` for a skill list.
+
+    Skills are matched in one pass with an Aho-Corasick automaton. Single
+    character skills (e.g. "r") are left out of the automaton, which would
+    otherwise report a hit for every stray letter, and are matched with one
+    whole-word regex instead.
+
+    Parameters
+    ----------
+    skill_list : list[str]
+        Canonical skill list to match.
+
+    Returns
+    -------
+    SkillMatcher
+        Automaton, single-character regex, each skill's position in
+        `skill_list` (used to order results), and a character-class regex
+        of the characters skills start with (used to skip texts that cannot
+        match).
+    """
+    # dict.fromkeys drops repeated skills while keeping first-seen order.
+    order = {sk: i for i, sk in enumerate(dict.fromkeys(skill_list))}
+
+    automaton = None
+    multi_char = [sk for sk in order if len(sk) > 1]
+    if multi_char:
+        automaton = ahocorasick.Automaton()
+        for sk in multi_char:
+            automaton.add_word(sk, sk)
+        automaton.make_automaton()
+
+    single_re = None
+    single_char = [sk for sk in order if len(sk) == 1]
+    if single_char:
+        single_re = re.compile(rf"(?<!\w)[{re.escape(''.join(single_char))}](?!\w)")
+
+    first_chars = sorted({sk[0] for sk in order if sk})
+    first_char_re = re.compile(f"[{re.escape(''.join(first_chars))}]") if first_chars else None
+
+    return SkillMatcher(automaton, single_re, order, first_char_re)
+
+
+_SKILL_MATCHER = build_skill_matcher(SKILLS)
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _scan_skills(t: str, matcher: SkillMatcher, found: set) -> None:
+    """
+    Add every skill of `matcher` that occurs in lowercased text `t` to `found`.
+    """
+    # Texts without any character a skill starts with (empty, symbols only,
+    # non-Latin scripts) cannot match. The probe runs in C and stops at the
+    # first candidate, so it is ~10x cheaper than a full scan.
+    if matcher.first_char_re is None or not matcher.first_char_re.search(t):
+        return
+    automaton, single_re = matcher.automaton, matcher.single_re
+    if automaton is not None:
+        n = len(t)
+        for end, sk in automaton.iter(t):
+            if len(sk) <= 3:
+                start = end - len(sk) + 1
+                if (start > 0 and _is_word_char(t[start - 1])) or (end + 1 < n and _is_word_char(t[end + 1])):
+                    continue
+            found.add(sk)
+    if single_re is not None:
+        found.update(m.group(0) for m in single_re.finditer(t))
+
 
 def extract_skills(text: str, skill_list: List[str] = SKILLS) -> List[str]:
     """
     Extract skills by keyword matching from text.
 
+    Skills of up to three characters (e.g. "r", "sql", "c++") only count as
+    whole words; longer skills match anywhere.
+
     Parameters
     ----------
     text : str
@@ -333,25 +853,47 @@ def extract_skills(text: str, skill_list: List[str] = SKILLS) -> List[str]:
     Returns
     -------
     list[str]
-        Skills found in the text.
-    """
-    t = (text or "").lower()
-    found: List[str] = []
-    for sk in skill_list:
-        if len(sk) <= 3 or sk in {"r"}:
-            if re.search(rf"\b{re.escape(sk)}\b", t):
-                found.append(sk)
-        else:
-            if sk in t:
-                found.append(sk)
-
-    seen = set()
-    out: List[str] = []
-    for x in found:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+        Skills found in the text, in `skill_list` order.
+    """
+    matcher = _SKILL_MATCHER if skill_list is SKILLS else build_skill_matcher(skill_list)
+    found: set = set()
+    _scan_skills((text or "").lower(), matcher, found)
+    return sorted(found, key=matcher.order.__getitem__)
+
+
+def extract_post_skills(title: str, description: str, skill_list: List[str] = SKILLS) -> List[str]:
+    """
+    Extract skills from a post's title and description.
+
+    Equivalent to `extract_skills(title + " " + description)`, except that a
+    match cannot span the two fields, without building the joined string.
+
+    Parameters
+    ----------
+    title : str
+        Job title.
+    description : str
+        Job description.
+    skill_list : list[str]
+        Canonical skill list to match.
+
+    Returns
+    -------
+    list[str]
+        Skills found in either field, in `skill_list` order.
+    """
+    matcher = _SKILL_MATCHER if skill_list is SKILLS else build_skill_matcher(skill_list)
+    return _post_skills_lower((title or "").lower(), (description or "").lower(), matcher)
+
+
+def _post_skills_lower(title_l: str, description_l: str, matcher: SkillMatcher = _SKILL_MATCHER) -> List[str]:
+    """
+    `extract_post_skills` for fields that are already lowercased.
+    """
+    found: set = set()
+    _scan_skills(title_l, matcher, found)
+    _scan_skills(description_l, matcher, found)
+    return sorted(found, key=matcher.order.__getitem__)
 
 
 def categorize_role(title: str) -> str:
@@ -369,8 +911,8 @@ def categorize_role(title: str) -> str:
         Role category label.
     """
     t = (title or "").lower()
-    for role, keys in ROLE_KEYWORDS.items():
-        if any(k in t for k in keys):
+    for k, role in _ROLE_KEYWORD_PAIRS:
+        if k in t:
             return role
     return "Other"
 
@@ -390,14 +932,66 @@ def classify_region(location: str) -> str:
         Region bucket.
     """
     text = (location or "").lower()
-    for region, keys in REGION_KEYWORDS.items():
-        if any(k in text for k in keys):
+    for k, region in _REGION_KEYWORD_PAIRS:
+        if k in text:
             return region
-    if "remote" in text:
-        return "Remote/Unspecified"
     return "Other/Unspecified"
 
 
+def _first_matching_bucket(lowered: pd.Series, patterns: Dict[str, str], default: str) -> np.ndarray:
+    """
+    Label each (lowercased) string with the first bucket whose pattern it contains.
+    """
+    conditions = [
+        lowered.str.contains(pattern, regex=True).to_numpy(dtype=bool, na_value=False) for pattern in patterns.values()
+    ]
+    return np.select(conditions, list(patterns), default=default)
+
+
+def _salary_numbers_regex(txt: str) -> List[float]:
+    """
+    Extract salary amounts (with optional "k" suffix) using `_SALARY_NUM_RE`.
+    """
+    nums: List[float] = []
+    for m in _SALARY_NUM_RE.finditer(txt):
+        val = float(m.group(1))
+        if m.group(2) == "k":
+            val *= 1000.0
+        nums.append(val)
+    return nums
+
+
+def _salary_numbers_fast(txt: str) -> List[float]:
+    """
+    Single-pass character scan equivalent to `_salary_numbers_regex`.
+
+    Only valid for ASCII input; `re` also treats non-ASCII digits and spaces
+    as matches.
+    """
+    nums: List[float] = []
+    i, n = 0, len(txt)
+    while i < n:
+        if txt[i] not in _ASCII_DIGITS:
+            i += 1
+            continue
+        start = i
+        i += 1
+        while i < n and txt[i] in _ASCII_DIGITS:
+            i += 1
+        if i + 1 < n and txt[i] == "." and txt[i + 1] in _ASCII_DIGITS:
+            i += 2
+            while i < n and txt[i] in _ASCII_DIGITS:
+                i += 1
+        val = float(txt[start:i])
+        while i < n and txt[i] in _ASCII_SPACES:
+            i += 1
+        if i < n and txt[i] == "k":
+            val *= 1000.0
+            i += 1
+        nums.append(val)
+    return nums
+
+
 def parse_salary_to_yearly_usd(s: str) -> Tuple[Optional[float], Optional[float], str]:
     """
     Parse a salary string and attempt to convert it to yearly USD range.
@@ -425,13 +1019,7 @@ def parse_salary_to_yearly_usd(s: str) -> Tuple[Optional[float], Optional[float]
     elif "/week" in txt or "per week" in txt:
         unit = "week"
 
-    nums: List[float] = []
-    for m in re.finditer(r"(\d+(?:\.\d+)?)\s*(k)?", txt):
-        val = float(m.group(1))
-        if m.group(2) == "k":
-            val *= 1000.0
-        nums.append(val)
-
+    nums = _salary_numbers_fast(txt) if txt.isascii() else _salary_numbers_regex(txt)
     if not nums:
         return None, None, unit
 
@@ -456,63 +1044,144 @@ def parse_salary_to_yearly_usd(s: str) -> Tuple[Optional[float], Optional[float]
     return lo, hi, unit
 
 
-def clean_posts(df: pd.DataFrame) -> pd.DataFrame:
+def _derive_features(out: pd.DataFrame) -> pd.DataFrame:
     """
-    Clean raw scraped posts into a structured dataset for analysis.
+    Add role, region, skill, and salary columns to cleaned posts.
+
+    Module-level (and row-independent) so `clean_posts` can run it on chunks
+    in worker processes.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        Raw DataFrame from scraped JobPost dictionaries.
+    out : pandas.DataFrame
+        Deduplicated posts with cleaned text columns.
 
     Returns
     -------
     pandas.DataFrame
-        Cleaned DataFrame with derived columns (role, region, skills, salary).
+        `out` with the derived columns appended.
     """
-    out = df.copy()
-
-    out["title"] = out["title"].map(clean_text)
-    out["company"] = out["company"].map(clean_text)
-    out["location"] = out["location"].map(clean_text)
-    out["description"] = out["description"].map(clean_text)
-    out["source"] = out["source"].map(clean_text)
-    out["url"] = out["url"].map(clean_text)
+    # Lowercase each text column once and share it between the extractors.
+    title_l = out["title"].str.lower()
+    location_l = out["location"].str.lower()
+    description_l = out["description"].str.lower()
 
-    out = out.drop_duplicates(subset=["url"]).reset_index(drop=True)
+    out["role_category"] = _first_matching_bucket(title_l, _ROLE_PATTERNS, "Other")
+    out["region"] = _first_matching_bucket(location_l, _REGION_PATTERNS, "Other/Unspecified")
 
-    out["role_category"] = out["title"].map(categorize_role)
-    out["region"] = out["location"].map(classify_region)
-
-    out["skills"] = (out["title"] + " " + out["description"]).map(extract_skills)
+    out["skills"] = [_post_skills_lower(t, d) for t, d in zip(title_l, description_l)]
     out["num_skills"] = out["skills"].map(len)
 
-    parsed = out["salary_raw"].map(parse_salary_to_yearly_usd)
-    out["salary_min_usd_year"] = parsed.map(lambda t: t[0])
-    out["salary_max_usd_year"] = parsed.map(lambda t: t[1])
-    out["salary_unit_guess"] = parsed.map(lambda t: t[2])
-    out["salary_mid_usd_year"] = out[["salary_min_usd_year", "salary_max_usd_year"]].mean(axis=1)
+    salary = pd.DataFrame(
+        out["salary_raw"].map(parse_salary_to_yearly_usd).tolist(),
+        index=out.index,
+        columns=["salary_min_usd_year", "salary_max_usd_year", "salary_unit_guess"],
+    ).astype({"salary_min_usd_year": float, "salary_max_usd_year": float})
+    out = pd.concat([out, salary], axis=1)
+    # min and max are either both set or both missing, so this matches a NaN-skipping mean.
+    out["salary_mid_usd_year"] = (out["salary_min_usd_year"].to_numpy() + out["salary_max_usd_year"].to_numpy()) / 2.0
 
     return out
 
 
-def collect_posts(remoteok_limit: int = 150, remotive_limit: int = 150) -> pd.DataFrame:
+def clean_posts(df: pd.DataFrame, n_jobs: Optional[int] = None) -> pd.DataFrame:
+    """
+    Clean raw scraped posts into a structured dataset for analysis.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Raw DataFrame from scraped JobPost dictionaries.
+    n_jobs : int | None
+        Number of worker processes for feature extraction. None uses all CPUs
+        once there are at least `PARALLEL_MIN_ROWS` posts, and runs in-process
+        otherwise; 1 always runs in-process.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Cleaned DataFrame with derived columns (role, region, skills, salary).
+    """
+    # Deduplicate first so the remaining cleaning only runs on rows we keep.
+    # URLs differing only in case or a trailing slash count as the same post.
+    # Filtering already yields a new frame, so `df` itself is never copied or
+    # modified.
+    url = clean_text_series(df["url"])
+    keep = (~url.str.lower().str.rstrip("/").duplicated()).to_numpy()
+    out = df[keep].reset_index(drop=True)
+    out["url"] = url[keep].reset_index(drop=True)
+
+    for col in ["title", "company", "location", "description", "source"]:
+        out[col] = clean_text_series(out[col])
+
+    if n_jobs is None:
+        n_jobs = (os.cpu_count() or 1) if len(out) >= PARALLEL_MIN_ROWS else 1
+    n_jobs = min(n_jobs, len(out))
+    if n_jobs <= 1:
+        return _derive_features(out)
+
+    bounds = np.linspace(0, len(out), n_jobs + 1).astype(int)
+    chunks = [out.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+        return pd.concat(ex.map(_derive_features, chunks))
+
+
+async def _collect_posts_async(
+    remoteok_limit: int, remotive_limit: int, cache: Optional[DescriptionCache] = None
+) -> List[JobPost]:
+    """
+    Scrape all sources concurrently over one pooled aiohttp session.
+
+    Parameters
+    ----------
+    remoteok_limit : int
+        Max RemoteOK records.
+    remotive_limit : int
+        Max Remotive records.
+    cache : DescriptionCache | None
+        Optional cache of cleaned descriptions.
+
+    Returns
+    -------
+    list[JobPost]
+        RemoteOK posts followed by Remotive posts.
+    """
+    connector = aiohttp.TCPConnector(limit=HTTP_POOL_LIMIT, ttl_dns_cache=DNS_CACHE_TTL_S)
+    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS, connector=connector) as session:
+        remoteok, remotive = await asyncio.gather(
+            scrape_remoteok_async(session, limit=remoteok_limit, cache=cache),
+            scrape_remotive_async(session, limit=remotive_limit, category="software-dev", search="data", cache=cache),
+        )
+    return remoteok + remotive
+
+
+def collect_posts(
+    remoteok_limit: int = 150, remotive_limit: int = 150, cache_path: Optional[str] = None
+) -> pd.DataFrame:
     """
     Collect posts from all configured sources and return a raw DataFrame.
 
+    Sources are fetched concurrently, so wall time is bounded by the slowest
+    source rather than the sum of all of them.
+
     Parameters
     ----------
     remoteok_limit : int
         Max RemoteOK records.
     remotive_limit : int
         Max Remotive records.
+    cache_path : str | None
+        Optional SQLite file used as a `DescriptionCache`, so posts seen in
+        earlier runs skip HTML parsing.
 
     Returns
     -------
     pandas.DataFrame
         Raw combined dataset.
     """
-    posts: List[JobPost] = []
-    posts += scrape_remoteok(limit=remoteok_limit)
-    posts += scrape_remotive(limit=remotive_limit, category="software-dev", search="data")
-    return pd.DataFrame(posts_to_dicts(posts))
\ No newline at end of file
+    with DescriptionCache(cache_path) if cache_path else nullcontext() as cache:
+        posts = run_coroutine(_collect_posts_async(remoteok_limit, remotive_limit, cache))
+    df = pd.DataFrame(posts_to_dicts(posts), columns=list(JobPost.__slots__))
+    # Arrow-backed strings are far more compact than Python str objects and
+    # let the .str methods in clean_posts run as vectorized kernels.
+    return df.astype(dict.fromkeys(JobPost.__slots__, RAW_STRING_DTYPE))
\ No newline at end of file